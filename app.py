@@ -3,9 +3,14 @@
 import logging
 import os
 import tempfile
+from concurrent.futures import Future
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import wait
+from concurrent.futures.process import BrokenProcessPool
 from dataclasses import dataclass
 from enum import Enum
 from typing import Dict
+from typing import List
 from typing import Optional
 from typing import Tuple
 
@@ -15,6 +20,13 @@ import stl
 import streamlit as st
 
 from gridfinity_plate_generator import gridfinity_generator
+from gridfinity_plate_generator.backends import UnknownBackendError
+from gridfinity_plate_generator.backends import available_backends
+from gridfinity_plate_generator.config import default_backend
+from gridfinity_plate_generator.warmup import WarmupReport
+from gridfinity_plate_generator.warmup import generate_plate
+from gridfinity_plate_generator.warmup import start_worker_pool
+from gridfinity_plate_generator.warmup import worker_reports
 
 
 # Constants
@@ -75,6 +87,36 @@ def setup_page() -> None:
     )
 
 
+@st.cache_resource
+def start_warm_up() -> Tuple[ProcessPoolExecutor, List[Future[Optional[WarmupReport]]]]:
+    """Start the warm worker pool once per server process.
+
+    Plates are only generated in the workers, so the server process itself is
+    not warmed up and the first page load does not wait for the workers.
+
+    Returns:
+        Tuple of (worker pool, futures resolving to each worker's warm-up report)
+    """
+    return start_worker_pool()
+
+
+def warm_up_caption(ready: List[Future[Optional[WarmupReport]]]) -> str:
+    """Describe the warm-up latencies measured in the pool workers.
+
+    Args:
+        ready: Futures returned by ``start_worker_pool``
+
+    Returns:
+        Caption listing the report of every worker that finished warming up
+    """
+    reports = worker_reports(ready)
+    if not reports:
+        return "⚡ Workers are warming up..."
+    return "⚡ Worker warm-up: " + "; ".join(
+        f"worker {index}: {report}" for index, report in enumerate(reports, start=1)
+    )
+
+
 def create_stl_figure(file_path: str) -> go.Figure:
     """Create a 3D figure from an STL file.
 
@@ -116,49 +158,120 @@ def create_stl_figure(file_path: str) -> go.Figure:
     return fig
 
 
-def generate_model(
-    plate_type: PlateType,
+def generate_models(
+    plate_types: Tuple[PlateType, ...],
     cols: Optional[int] = None,
     rows: Optional[int] = None,
     width: Optional[float] = None,
     length: Optional[float] = None,
-) -> GeneratedModel:
-    """Generate a gridfinity model and create a 3D visualization.
+    backend: str = default_backend,
+    pool: Optional[ProcessPoolExecutor] = None,
+) -> Dict[PlateType, GeneratedModel]:
+    """Generate gridfinity models and create their 3D visualizations.
+
+    With a worker pool every plate is submitted before waiting on any of them,
+    so the plates are generated in parallel. If the pool is broken (e.g. a
+    worker died) it is discarded, to be restarted on the next run, and the
+    plates are generated in this process instead. The same fallback is used
+    for backends the workers have not registered.
 
     Args:
-        plate_type: Type of plate to generate (base or bottom)
+        plate_types: Types of plates to generate (base and/or bottom)
         cols: Number of columns (grid-based generation)
         rows: Number of rows (grid-based generation)
         width: Width in mm (dimension-based generation)
         length: Length in mm (dimension-based generation)
+        backend: Name of the geometry backend to generate with
+        pool: Warm worker pool to generate in, or None to generate in-process
 
     Returns:
-        Object containing the figure, file path, and filename
+        Dictionary mapping plate types to their generated models
     """
     logger.info(
-        f"Generating {plate_type} with cols={cols}, rows={rows}, width={width}, length={length}"
+        f"Generating {', '.join(plate_types)} with cols={cols}, rows={rows}, width={width}, "
+        f"length={length}, backend={backend}"
     )
 
-    # Create a temporary file that won't be automatically deleted
-    fd, filename = tempfile.mkstemp(suffix=".stl")
-    os.close(fd)  # Close the file descriptor but keep the file
-
-    generator_func = getattr(gridfinity_generator, plate_type)
-
-    # Call the appropriate generator function with the right parameters
+    # Determine the generator parameters shared by all plate types
     if cols is not None and rows is not None:
-        generator_func(columns=cols, rows=rows, output_filename=filename)
-        name = f"gridfinity_{plate_type}_{cols}x{rows}.stl"
+        dimensions = dict(columns=cols, rows=rows)
+        size = f"{cols}x{rows}"
     elif width is not None and length is not None:
-        generator_func(width=width, length=length, output_filename=filename)
-        name = f"gridfinity_{plate_type}_{width}x{length}mm.stl"
+        dimensions = dict(width=width, length=length)
+        size = f"{width}x{length}mm"
     else:
         raise ValueError("Either (cols, rows) or (width, length) must be provided")
 
-    figure = create_stl_figure(filename)
+    filenames = {}
+    for plate_type in plate_types:
+        # Create a temporary file that won't be automatically deleted
+        fd, filenames[plate_type] = tempfile.mkstemp(suffix=".stl")
+        os.close(fd)  # Close the file descriptor but keep the file
+
+    if pool is not None:
+        try:
+            futures = [
+                pool.submit(
+                    generate_plate, plate_type.value, filename, backend=backend, **dimensions
+                )
+                for plate_type, filename in filenames.items()
+            ]
+            for future in futures:
+                future.result()
+        except BrokenProcessPool:
+            logger.exception("Worker pool is broken, restarting it and generating in-process")
+            pool.shutdown(wait=False, cancel_futures=True)
+            start_warm_up.clear()
+            pool = None
+        except UnknownBackendError:
+            # E.g. a backend registered in the app itself, which workers never import
+            logger.warning(f"Workers do not know backend {backend}, generating in-process")
+            wait(futures)
+            pool = None
+
+    if pool is None:
+        for plate_type, filename in filenames.items():
+            generator_func = getattr(gridfinity_generator, plate_type)
+            generator_func(output_filename=filename, backend=backend, **dimensions)
+
+    # Return an object with all the model data per plate type
+    return {
+        plate_type: GeneratedModel(
+            figure=create_stl_figure(filename),
+            path=filename,
+            name=f"gridfinity_{plate_type.value}_{size}.stl",
+        )
+        for plate_type, filename in filenames.items()
+    }
+
 
-    # Return an object with all the model data
-    return GeneratedModel(figure=figure, path=filename, name=name)
+def generate_model(
+    plate_type: PlateType,
+    cols: Optional[int] = None,
+    rows: Optional[int] = None,
+    width: Optional[float] = None,
+    length: Optional[float] = None,
+    backend: str = default_backend,
+    pool: Optional[ProcessPoolExecutor] = None,
+) -> GeneratedModel:
+    """Generate a gridfinity model and create a 3D visualization.
+
+    Args:
+        plate_type: Type of plate to generate (base or bottom)
+        cols: Number of columns (grid-based generation)
+        rows: Number of rows (grid-based generation)
+        width: Width in mm (dimension-based generation)
+        length: Length in mm (dimension-based generation)
+        backend: Name of the geometry backend to generate with
+        pool: Warm worker pool to generate in, or None to generate in-process
+
+    Returns:
+        Object containing the figure, file path, and filename
+    """
+    models = generate_models(
+        (plate_type,), cols=cols, rows=rows, width=width, length=length, backend=backend, pool=pool
+    )
+    return models[plate_type]
 
 
 def process_user_input(
@@ -166,6 +279,8 @@ def process_user_input(
     rows: Optional[int] = None,
     width: Optional[float] = None,
     length: Optional[float] = None,
+    backend: str = default_backend,
+    pool: Optional[ProcessPoolExecutor] = None,
 ) -> Dict[PlateType, GeneratedModel]:
     """Process user input to generate figures and return them.
 
@@ -174,6 +289,8 @@ def process_user_input(
         rows: Number of rows (grid-based generation)
         width: Width in mm (dimension-based generation)
         length: Length in mm (dimension-based generation)
+        backend: Name of the geometry backend to generate with
+        pool: Warm worker pool to generate in, or None to generate in-process
 
     Returns:
         Dictionary mapping plate types to their generated models
@@ -183,11 +300,14 @@ def process_user_input(
     models = {}
 
     if (cols is not None and rows is not None) or (width is not None and length is not None):
-        models[PlateType.BOTTOM] = generate_model(
-            PlateType.BOTTOM, cols=cols, rows=rows, width=width, length=length
-        )
-        models[PlateType.BASE] = generate_model(
-            PlateType.BASE, cols=cols, rows=rows, width=width, length=length
+        models = generate_models(
+            (PlateType.BOTTOM, PlateType.BASE),
+            cols=cols,
+            rows=rows,
+            width=width,
+            length=length,
+            backend=backend,
+            pool=pool,
         )
 
     return models
@@ -285,6 +405,23 @@ def dimension_input_form() -> Tuple[Optional[float], Optional[float]]:
         return (width, length) if submitted else (None, None)
 
 
+def backend_selector() -> str:
+    """Let the user pick a geometry backend when more than one is registered.
+
+    Returns:
+        Name of the selected backend
+    """
+    backends = available_backends()
+    if len(backends) < 2:
+        return default_backend
+
+    return st.selectbox(
+        "Geometry backend ⚙️",
+        options=backends,
+        index=backends.index(default_backend) if default_backend in backends else 0,
+    )
+
+
 def main() -> None:
     """Main function to run the Streamlit app."""
     try:
@@ -294,14 +431,19 @@ def main() -> None:
         if "models" not in st.session_state:
             st.session_state.models = {}
 
+        # Start the warm worker pool once per server process
+        pool, ready = start_warm_up()
+
         # Setup page UI
         setup_page()
+        st.caption(warm_up_caption(ready))
 
         # Parameter section
         st.subheader("Parameters 🛠️")
         st.write("Use either of the forms below to create your Gridfinity plate!")
 
         # Input forms
+        backend = backend_selector()
         cols, rows = grid_input_form()
         width, length = dimension_input_form()
 
@@ -313,12 +455,16 @@ def main() -> None:
             with preview_placeholder.container():
                 st.subheader("Preview")
                 with st.spinner("Generating grid plates... This may take a moment ⏳", show_time=True):
-                    st.session_state.models = process_user_input(cols=cols, rows=rows)
+                    st.session_state.models = process_user_input(
+                        cols=cols, rows=rows, backend=backend, pool=pool
+                    )
         elif width is not None and length is not None:
             with preview_placeholder.container():
                 st.subheader("Preview")
                 with st.spinner("Generating custom plates... This may take a moment ⏳", show_time=True):
-                    st.session_state.models = process_user_input(width=width, length=length)
+                    st.session_state.models = process_user_input(
+                        width=width, length=length, backend=backend, pool=pool
+                    )
 
         # Display models
         if cols is not None or width is not None:
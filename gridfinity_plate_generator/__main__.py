@@ -3,6 +3,8 @@ import math
 import typer
 
 from gridfinity_plate_generator import gridfinity_generator
+from gridfinity_plate_generator import thumbnails
+from gridfinity_plate_generator.config import default_backend
 
 
 app = typer.Typer()
@@ -20,6 +22,8 @@ def base(
     bottom_chamfer_height: float = typer.Option(0.985 / math.sqrt(2), "--bottom-chamfer-height"),
     straight_wall_height: float = typer.Option(1.8, "--straight-wall-height"),
     verbose: bool = typer.Option(False, "--verbose", "-v"),
+    deterministic: bool = typer.Option(False, "--deterministic"),
+    backend: str = typer.Option(default_backend, "--backend", "-b"),
 ) -> None:
     gridfinity_generator.base(
         columns=columns,
@@ -32,6 +36,8 @@ def base(
         bottom_chamfer_height=bottom_chamfer_height,
         straight_wall_height=straight_wall_height,
         verbose=verbose,
+        deterministic=deterministic,
+        backend=backend,
     )
 
 
@@ -47,8 +53,10 @@ def bottom(
     bottom_chamfer_height: float = typer.Option(0.985 / math.sqrt(2), "--bottom-chamfer-height"),
     straight_wall_height: float = typer.Option(1.8, "--straight-wall-height"),
     verbose: bool = typer.Option(False, "--verbose", "-v"),
+    deterministic: bool = typer.Option(False, "--deterministic"),
+    backend: str = typer.Option(default_backend, "--backend", "-b"),
 ) -> None:
-    bottom(
+    gridfinity_generator.bottom(
         columns=columns,
         rows=rows,
         output_filename=output_filename,
@@ -59,8 +67,26 @@ def bottom(
         bottom_chamfer_height=bottom_chamfer_height,
         straight_wall_height=straight_wall_height,
         verbose=verbose,
+        deterministic=deterministic,
+        backend=backend,
     )
 
 
+@app.command()  # type: ignore
+def thumbnail(
+    meshes: list[str] = typer.Argument(..., help="STL or 3MF files to render"),
+    output_dir: str = typer.Option(".", "--output-dir", "-o"),
+    size: int = typer.Option(256, "--size", "-s"),
+    workers: int = typer.Option(None, "--workers", "-w"),
+    verbose: bool = typer.Option(False, "--verbose", "-v"),
+) -> None:
+    gridfinity_generator.setup_logging(verbose)
+    written = thumbnails.render_thumbnails(meshes, output_dir, size=size, max_workers=workers)
+    if len(written) < len(meshes):
+        failed = len(meshes) - len(written)
+        typer.echo(f"Failed to render {failed} of {len(meshes)} mesh(es).", err=True)
+        raise typer.Exit(code=1)
+
+
 if __name__ == "__main__":
     app()
@@ -0,0 +1,250 @@
+"""Geometry backends used to build gridfinity plates.
+
+A backend wraps the handful of operations the generator needs (sketch, sweep,
+pattern, plate, cut, export) plus the properties used to check that backends
+agree with each other. ``CadQueryBackend`` is the reference implementation;
+further engines are added with ``register_backend`` and selected by name.
+"""
+
+import logging
+from abc import ABC
+from abc import abstractmethod
+from collections.abc import Callable
+from collections.abc import Iterable
+from collections.abc import Sequence
+from typing import Any
+
+import cadquery as cq
+
+from gridfinity_plate_generator import exporters
+
+
+Shape = Any
+Point = tuple[float, float, float]
+Mesh = tuple[list[Point], list[tuple[int, int, int]]]
+BoundingBox = tuple[float, float, float, float, float, float]
+
+EXPORT_TOLERANCE = 0.99
+EXPORT_ANGULAR_TOLERANCE = 0.5
+
+
+class GeometryBackend(ABC):
+    """Operations a geometry engine must provide to generate plates."""
+
+    name: str
+
+    @abstractmethod
+    def sketch(self, width: float, radius: float) -> Shape:
+        """Return a square profile of side ``width`` with rounded corners."""
+
+    @abstractmethod
+    def sweep(
+        self, profile: Shape, segments: Sequence[tuple[float, float]], origin: Point
+    ) -> Shape:
+        """Extrude ``profile`` downwards from ``origin`` through stacked segments.
+
+        Each segment is a ``(distance, taper)`` pair as passed to
+        ``Workplane.extrude``, the taper being the inward draft in degrees.
+        """
+
+    @abstractmethod
+    def pattern(self, tool: Shape, positions: Iterable[tuple[float, float]]) -> Shape:
+        """Return the union of ``tool`` translated to every XY position."""
+
+    @abstractmethod
+    def plate(self, length: float, width: float, zmin: float, zmax: float, radius: float) -> Shape:
+        """Return a ``length`` × ``width`` box from the origin spanning ``zmin``..``zmax``.
+
+        The vertical edges are filleted with ``radius``.
+        """
+
+    @abstractmethod
+    def cut(self, shape: Shape, tool: Shape) -> Shape:
+        """Return ``shape`` with ``tool`` subtracted."""
+
+    @abstractmethod
+    def tessellate(
+        self,
+        shape: Shape,
+        tolerance: float = EXPORT_TOLERANCE,
+        angular_tolerance: float = EXPORT_ANGULAR_TOLERANCE,
+    ) -> Mesh:
+        """Return a ``(vertices, triangles)`` mesh of ``shape``."""
+
+    @abstractmethod
+    def volume(self, shape: Shape) -> float:
+        """Return the enclosed volume in mm³."""
+
+    @abstractmethod
+    def bounding_box(self, shape: Shape) -> BoundingBox:
+        """Return ``(xmin, ymin, zmin, xmax, ymax, zmax)``."""
+
+    @abstractmethod
+    def is_watertight(self, shape: Shape) -> bool:
+        """Return whether ``shape`` is valid and bounded by closed shells."""
+
+    def face_count(self, shape: Shape) -> int | None:
+        """Return the number of BREP faces, or None for mesh-only backends."""
+        return None
+
+    def pocket_count(self, shape: Shape) -> int | None:
+        """Return the number of holes in the bottom face, or None if unsupported."""
+        return None
+
+    def export(
+        self, shape: Shape, output_filename: str, deterministic: bool = False
+    ) -> str | None:
+        """Export a shape as STL/3MF, optionally with a content hash.
+
+        The default writes the tessellated mesh with sorted facets, rounded
+        coordinates and fixed headers/timestamps. In deterministic mode its
+        SHA-256 is also stored in a ``.sha256`` sidecar next to the output.
+
+        Returns:
+            The content hash in deterministic mode, otherwise None
+        """
+        vertices, triangles = self.tessellate(shape)
+        if deterministic:
+            return exporters.export_mesh(vertices, triangles, output_filename)
+
+        exporters.write_mesh(vertices, triangles, output_filename)
+        return None
+
+
+class UnknownBackendError(ValueError):
+    """Raised when no backend is registered under the requested name."""
+
+
+_BACKENDS: dict[str, type[GeometryBackend]] = {}
+_INSTANCES: dict[str, GeometryBackend] = {}
+
+
+def register_backend(
+    name: str,
+) -> Callable[[type[GeometryBackend]], type[GeometryBackend]]:
+    """Class decorator registering a backend under ``name``."""
+
+    def decorator(cls: type[GeometryBackend]) -> type[GeometryBackend]:
+        cls.name = name
+        _BACKENDS[name] = cls
+        _INSTANCES.pop(name, None)
+        return cls
+
+    return decorator
+
+
+def available_backends() -> list[str]:
+    """Return the names of all registered backends."""
+    return sorted(_BACKENDS)
+
+
+def backend_modules() -> list[str]:
+    """Return the importable modules defining the registered backends.
+
+    Importing them in another process, such as a ``spawn`` worker, registers
+    the same backends there. Backends defined in ``__main__`` are left out.
+    """
+    return sorted({cls.__module__ for cls in _BACKENDS.values()} - {"__main__"})
+
+
+def get_backend(name: str) -> GeometryBackend:
+    """Return the (shared) backend instance registered under ``name``."""
+    if name not in _BACKENDS:
+        raise UnknownBackendError(
+            f"Unknown geometry backend '{name}', choose one of: {', '.join(available_backends())}."
+        )
+    if name not in _INSTANCES:
+        _INSTANCES[name] = _BACKENDS[name]()
+    return _INSTANCES[name]
+
+
+@register_backend("cadquery")
+class CadQueryBackend(GeometryBackend):
+    """Reference backend built on CadQuery/OCCT; shapes are ``cq.Workplane``."""
+
+    def sketch(self, width: float, radius: float) -> cq.Sketch:
+        return cq.Sketch().rect(width, width).vertices().fillet(radius)
+
+    def sweep(
+        self, profile: cq.Sketch, segments: Sequence[tuple[float, float]], origin: Point
+    ) -> cq.Workplane:
+        tool = cq.Workplane("XY").placeSketch(profile)
+        for index, (height, taper) in enumerate(segments):
+            if index:
+                tool = tool.faces(">Z").wires().toPending()
+            tool = tool.extrude(height, taper=taper)
+        return tool.rotate((0, 0, 0), (1, 0, 0), 180).translate(origin)
+
+    def pattern(self, tool: cq.Workplane, positions: Iterable[tuple[float, float]]) -> cq.Workplane:
+        # The tool may be cached and reused, so never let results share its
+        # topology: meshing a result would otherwise slow every later boolean
+        solid = tool.val()
+        if not isinstance(solid, cq.Shape):
+            raise TypeError(f"Expected a solid subtraction tool, got {type(solid).__name__}.")
+        solid = solid.copy()
+        return (
+            cq.Workplane("XY")
+            .pushPoints(list(positions))
+            .eachpoint(lambda loc: solid.moved(loc), combine="a", clean=True)
+        )
+
+    def plate(
+        self, length: float, width: float, zmin: float, zmax: float, radius: float
+    ) -> cq.Workplane:
+        return (
+            cq.Workplane("XY")
+            .box(length, width, zmax - zmin)
+            .edges("|Z")
+            .fillet(radius)
+            .translate((length / 2, width / 2, (zmin + zmax) / 2))
+        )
+
+    def cut(self, shape: cq.Workplane, tool: cq.Workplane) -> cq.Workplane:
+        return shape.faces(">Z").cut(tool)
+
+    def _compound(self, shape: cq.Workplane) -> cq.Compound:
+        return cq.Compound.makeCompound([obj for obj in shape.vals() if isinstance(obj, cq.Shape)])
+
+    def tessellate(
+        self,
+        shape: cq.Workplane,
+        tolerance: float = EXPORT_TOLERANCE,
+        angular_tolerance: float = EXPORT_ANGULAR_TOLERANCE,
+    ) -> Mesh:
+        vertices, triangles = self._compound(shape).tessellate(tolerance, angular_tolerance)
+        return [vertex.toTuple() for vertex in vertices], triangles
+
+    def volume(self, shape: cq.Workplane) -> float:
+        return float(self._compound(shape).Volume())
+
+    def bounding_box(self, shape: cq.Workplane) -> BoundingBox:
+        bb = self._compound(shape).BoundingBox()
+        return (bb.xmin, bb.ymin, bb.zmin, bb.xmax, bb.ymax, bb.zmax)
+
+    def is_watertight(self, shape: cq.Workplane) -> bool:
+        compound = self._compound(shape)
+        shells = compound.Shells()
+        return bool(compound.isValid() and shells and all(shell.Closed() for shell in shells))
+
+    def face_count(self, shape: cq.Workplane) -> int:
+        return len(self._compound(shape).Faces())
+
+    def pocket_count(self, shape: cq.Workplane) -> int:
+        faces = [face for face in shape.faces("<Z").vals() if isinstance(face, cq.Face)]
+        return sum(len(face.innerWires()) for face in faces)
+
+    def export(
+        self, shape: cq.Workplane, output_filename: str, deterministic: bool = False
+    ) -> str | None:
+        if deterministic:
+            return super().export(shape, output_filename, deterministic=True)
+
+        logging.debug(f"Exporting {output_filename} with cq.exporters")
+        cq.exporters.export(
+            shape,
+            output_filename,
+            tolerance=EXPORT_TOLERANCE,
+            angularTolerance=EXPORT_ANGULAR_TOLERANCE,
+        )
+        return None
+
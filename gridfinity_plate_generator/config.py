@@ -20,6 +20,13 @@ def get_env_variable(var_name: str, default: Any = None, required: bool = False)
     return value
 
 
+def get_env_flag(var_name: str, default: bool = False) -> bool:
+    value = get_env_variable(var_name)
+    if value is None:
+        return default
+    return str(value).strip().lower() in ("1", "true", "yes", "on")
+
+
 version = "0.1.0"
 
 # Set default values for bottom function using environment variables or hardcoded defaults
@@ -37,6 +44,10 @@ default_bottom_chamfer_height = float(
 )
 default_straight_wall_height = float(get_env_variable("DEFAULT_STRAIGHT_WALL_HEIGHT", default=1.8))
 default_verbose = bool(get_env_variable("DEFAULT_VERBOSE", default=False))
+default_backend = get_env_variable("DEFAULT_BACKEND", default="cadquery")
+default_deterministic = get_env_flag("DEFAULT_DETERMINISTIC")
+default_worker_count = int(get_env_variable("DEFAULT_WORKER_COUNT", default=2))
+default_thumbnail_size = int(get_env_variable("DEFAULT_THUMBNAIL_SIZE", default=256))
 
 # Log that the defaults were loaded
 logging.debug("Default values loaded successfully.")
@@ -0,0 +1,212 @@
+"""Deterministic mesh exporters with content hashes for gridfinity plates."""
+
+import hashlib
+import logging
+import math
+import os
+import struct
+import zipfile
+from collections.abc import Sequence
+
+
+Vertex = tuple[float, float, float]
+Facet = tuple[Vertex, Vertex, Vertex]
+
+DETERMINISTIC_FORMATS = ("stl", "3mf")
+DEFAULT_PRECISION = 5
+HASH_SUFFIX = ".sha256"
+
+STL_HEADER = b"gridfinity-plate-generator deterministic STL".ljust(80, b"\0")
+ZIP_TIMESTAMP = (1980, 1, 1, 0, 0, 0)
+
+CONTENT_TYPES_XML = """<?xml version="1.0" encoding="UTF-8"?>
+<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">
+ <Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>
+ <Default Extension="model" ContentType="application/vnd.ms-package.3dmanufacturing-3dmodel+xml"/>
+</Types>
+"""
+
+RELS_XML = """<?xml version="1.0" encoding="UTF-8"?>
+<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">
+ <Relationship Target="/3D/3dmodel.model" Id="rel0" Type="http://schemas.microsoft.com/3dmanufacturing/2013/01/3dmodel"/>
+</Relationships>
+"""
+
+
+def _round_vertex(vertex: Sequence[float], precision: int) -> Vertex:
+    # Adding 0.0 turns -0.0 into 0.0 so both serialise to the same bytes
+    x, y, z = (round(float(value), precision) + 0.0 for value in vertex)
+    return (x, y, z)
+
+
+def canonical_facets(
+    vertices: Sequence[Sequence[float]],
+    triangles: Sequence[Sequence[int]],
+    precision: int = DEFAULT_PRECISION,
+) -> list[Facet]:
+    """Round, normalise and sort a triangle mesh into a stable facet list.
+
+    Each triangle is rotated so its smallest vertex comes first (keeping the
+    winding), triangles collapsed by rounding are dropped and the result is
+    sorted, so the same geometry always yields the same facet sequence.
+    """
+    rounded = [_round_vertex(vertex, precision) for vertex in vertices]
+
+    facets = set()
+    for i, j, k in triangles:
+        a, b, c = rounded[i], rounded[j], rounded[k]
+        if a == b or b == c or a == c:
+            continue
+        smallest = min(a, b, c)
+        if smallest == b:
+            a, b, c = b, c, a
+        elif smallest == c:
+            a, b, c = c, a, b
+        facets.add((a, b, c))
+
+    return sorted(facets)
+
+
+def _facet_normal(facet: Facet, precision: int) -> Vertex:
+    (ax, ay, az), (bx, by, bz), (cx, cy, cz) = facet
+    ux, uy, uz = bx - ax, by - ay, bz - az
+    vx, vy, vz = cx - ax, cy - ay, cz - az
+    nx, ny, nz = uy * vz - uz * vy, uz * vx - ux * vz, ux * vy - uy * vx
+    length = math.sqrt(nx * nx + ny * ny + nz * nz) or 1.0
+    return _round_vertex((nx / length, ny / length, nz / length), precision)
+
+
+def write_stl(
+    facets: Sequence[Facet], output_filename: str, precision: int = DEFAULT_PRECISION
+) -> None:
+    """Write facets as a binary STL with a fixed header."""
+    with open(output_filename, "wb") as f:
+        f.write(STL_HEADER)
+        f.write(struct.pack("<I", len(facets)))
+        for facet in facets:
+            f.write(struct.pack("<3f", *_facet_normal(facet, precision)))
+            for vertex in facet:
+                f.write(struct.pack("<3f", *vertex))
+            f.write(struct.pack("<H", 0))
+
+
+def _model_xml(facets: Sequence[Facet], precision: int) -> str:
+    indices = {vertex: index for index, vertex in enumerate(sorted({v for f in facets for v in f}))}
+
+    lines = [
+        '<?xml version="1.0" encoding="UTF-8"?>',
+        '<model unit="millimeter" xml:lang="en-US"'
+        ' xmlns="http://schemas.microsoft.com/3dmanufacturing/core/2015/02">',
+        " <resources>",
+        '  <object id="1" type="model">',
+        "   <mesh>",
+        "    <vertices>",
+    ]
+    for x, y, z in indices:
+        lines.append(
+            f'     <vertex x="{x:.{precision}f}" y="{y:.{precision}f}" z="{z:.{precision}f}"/>'
+        )
+    lines.append("    </vertices>")
+    lines.append("    <triangles>")
+    for a, b, c in facets:
+        lines.append(f'     <triangle v1="{indices[a]}" v2="{indices[b]}" v3="{indices[c]}"/>')
+    lines.extend(
+        [
+            "    </triangles>",
+            "   </mesh>",
+            "  </object>",
+            " </resources>",
+            " <build>",
+            '  <item objectid="1"/>',
+            " </build>",
+            "</model>",
+            "",
+        ]
+    )
+    return "\n".join(lines)
+
+
+def write_3mf(
+    facets: Sequence[Facet], output_filename: str, precision: int = DEFAULT_PRECISION
+) -> None:
+    """Write facets as a 3MF package with fixed entry order and timestamps."""
+    entries = (
+        ("[Content_Types].xml", CONTENT_TYPES_XML),
+        ("_rels/.rels", RELS_XML),
+        ("3D/3dmodel.model", _model_xml(facets, precision)),
+    )
+    with zipfile.ZipFile(output_filename, "w") as archive:
+        for name, content in entries:
+            info = zipfile.ZipInfo(name, date_time=ZIP_TIMESTAMP)
+            info.compress_type = zipfile.ZIP_DEFLATED
+            info.create_system = 0
+            info.external_attr = 0o644 << 16
+            archive.writestr(info, content.encode("utf-8"), compresslevel=9)
+
+
+def content_hash(filename: str) -> str:
+    """Return the SHA-256 hex digest of a file."""
+    digest = hashlib.sha256()
+    with open(filename, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 16), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def write_hash_sidecar(filename: str, digest: str) -> str:
+    """Write ``digest`` next to ``filename`` in ``sha256sum`` format.
+
+    Returns:
+        The path of the sidecar file
+    """
+    sidecar = filename + HASH_SUFFIX
+    with open(sidecar, "w", encoding="utf-8") as f:
+        f.write(f"{digest}  {os.path.basename(filename)}\n")
+    return sidecar
+
+
+def mesh_format(filename: str) -> str:
+    """Return the mesh format of ``filename``, which must be one of ``DETERMINISTIC_FORMATS``."""
+    extension = os.path.splitext(filename)[1].lstrip(".").lower()
+    if extension not in DETERMINISTIC_FORMATS:
+        raise ValueError(
+            f"Mesh export supports {', '.join(DETERMINISTIC_FORMATS)}, not '{extension}'."
+        )
+    return extension
+
+
+def write_mesh(
+    vertices: Sequence[Sequence[float]],
+    triangles: Sequence[Sequence[int]],
+    output_filename: str,
+    precision: int = DEFAULT_PRECISION,
+) -> None:
+    """Write a triangle mesh as canonical facets, without a hash sidecar.
+
+    The format is picked from the file extension, see ``mesh_format``.
+    """
+    extension = mesh_format(output_filename)
+    facets = canonical_facets(vertices, triangles, precision)
+    logging.info(f"Writing {len(facets)} facets to {output_filename}")
+    if extension == "stl":
+        write_stl(facets, output_filename, precision)
+    else:
+        write_3mf(facets, output_filename, precision)
+
+
+def export_mesh(
+    vertices: Sequence[Sequence[float]],
+    triangles: Sequence[Sequence[int]],
+    output_filename: str,
+    precision: int = DEFAULT_PRECISION,
+) -> str:
+    """Deterministically export a triangle mesh and write its hash sidecar.
+
+    Returns:
+        The SHA-256 hex digest of the written file
+    """
+    write_mesh(vertices, triangles, output_filename, precision)
+    digest = content_hash(output_filename)
+    write_hash_sidecar(output_filename, digest)
+    logging.info(f"Content hash of {output_filename}: {digest}")
+    return digest
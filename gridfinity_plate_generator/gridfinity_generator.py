@@ -1,11 +1,16 @@
+import functools
 import logging
 import math
 
-import cadquery as cq
-
+from gridfinity_plate_generator import exporters
+from gridfinity_plate_generator.backends import GeometryBackend
+from gridfinity_plate_generator.backends import Shape
+from gridfinity_plate_generator.backends import get_backend
+from gridfinity_plate_generator.config import default_backend
 from gridfinity_plate_generator.config import default_baseplate_height
 from gridfinity_plate_generator.config import default_baseplate_width
 from gridfinity_plate_generator.config import default_bottom_chamfer_height
+from gridfinity_plate_generator.config import default_deterministic
 from gridfinity_plate_generator.config import default_output_filename
 from gridfinity_plate_generator.config import default_rounded_corner_radius
 from gridfinity_plate_generator.config import default_straight_wall_height
@@ -20,41 +25,80 @@ def setup_logging(verbose: bool) -> None:
         level=logging.DEBUG if verbose else logging.WARNING,
     )
 
-def create_grid_squares(
+
+@functools.lru_cache(maxsize=32)
+def subtraction_tool(
     baseplate_height: float | int,
     bottom_chamfer_height: float | int,
     straight_wall_height: float | int,
     subtracted_square_width: float | int,
     rounded_corner_radius: float | int,
     baseplate_width: float | int,
-    columns: int,
-    rows: int,
-) -> cq.Workplane:
+    geometry: GeometryBackend,
+) -> Shape:
+    """Build the tool subtracted from every grid cell.
+
+    The tool only depends on the profile, so it is cached and shared by every
+    plate generated with the same parameters in this process. The cache is
+    keyed on the backend instance rather than its name, so re-registering a
+    backend never reuses tools built by the class it replaced.
+    """
     top_chamfer_height = baseplate_height - bottom_chamfer_height - straight_wall_height
 
     logging.info("Creating 2D sketch with rounded corners for grid squares...")
-    rounded_square = (
-        cq.Sketch()
-        .rect(subtracted_square_width, subtracted_square_width)
-        .vertices()
-        .fillet(rounded_corner_radius)
-    )
+    rounded_square = geometry.sketch(subtracted_square_width, rounded_corner_radius)
 
     logging.info("Creating the tool used to subtract grid squares from the baseplate...")
-    square_subtraction_tool = (
-        cq.Workplane("XY")
-        .placeSketch(rounded_square)
-        .extrude(top_chamfer_height * math.sqrt(2), taper=45)
-        .faces(">Z")
-        .wires()
-        .toPending()
-        .extrude(straight_wall_height)
-        .faces(">Z")
-        .wires()
-        .toPending()
-        .extrude(bottom_chamfer_height * math.sqrt(2), taper=45)
-        .rotate((0, 0, 0), (1, 0, 0), 180)
-        .translate((baseplate_width / 2, baseplate_width / 2, baseplate_height))
+    return geometry.sweep(
+        rounded_square,
+        [
+            (top_chamfer_height * math.sqrt(2), 45),
+            (straight_wall_height, 0),
+            (bottom_chamfer_height * math.sqrt(2), 45),
+        ],
+        (baseplate_width / 2, baseplate_width / 2, baseplate_height),
+    )
+
+
+def export(
+    shape: Shape,
+    output_filename: str,
+    deterministic: bool = default_deterministic,
+    backend: str = default_backend,
+) -> str | None:
+    """Export a generated plate, optionally as a byte-reproducible STL/3MF.
+
+    In deterministic mode the mesh is written with sorted facets, rounded
+    coordinates and fixed headers/timestamps, and its SHA-256 is stored in a
+    ``.sha256`` sidecar next to the output.
+
+    Returns:
+        The content hash in deterministic mode, otherwise None
+    """
+    logging.info(f"Saving to {output_filename}")
+    return get_backend(backend).export(shape, output_filename, deterministic=deterministic)
+
+
+def create_grid_squares(
+    baseplate_height: float | int,
+    bottom_chamfer_height: float | int,
+    straight_wall_height: float | int,
+    subtracted_square_width: float | int,
+    rounded_corner_radius: float | int,
+    baseplate_width: float | int,
+    columns: int,
+    rows: int,
+    backend: str = default_backend,
+) -> Shape:
+    geometry = get_backend(backend)
+    square_subtraction_tool = subtraction_tool(
+        baseplate_height,
+        bottom_chamfer_height,
+        straight_wall_height,
+        subtracted_square_width,
+        rounded_corner_radius,
+        baseplate_width,
+        geometry,
     )
 
     logging.info("Determining grid square positions...")
@@ -65,18 +109,11 @@ def create_grid_squares(
     )
 
     logging.info("Combining grid squares for subtraction...")
-    combined_grid_squares = (
-        cq.Workplane("XY")
-        .pushPoints(grid_square_positions)
-        .eachpoint(
-            lambda loc: square_subtraction_tool.val().moved(loc),
-            combine="a",
-            clean=True,
-        )
-    )
+    combined_grid_squares = geometry.pattern(square_subtraction_tool, grid_square_positions)
 
     return combined_grid_squares
 
+
 def base(
     columns: int | None = None,
     rows: int | None = None,
@@ -90,7 +127,9 @@ def base(
     bottom_chamfer_height: float = default_bottom_chamfer_height,
     straight_wall_height: float = default_straight_wall_height,
     verbose: bool = default_verbose,
-) -> cq.Workplane:
+    deterministic: bool = default_deterministic,
+    backend: str = default_backend,
+) -> Shape:
     setup_logging(verbose)
 
     if (columns is not None and rows is not None) and (width is None and length is None):
@@ -103,6 +142,10 @@ def base(
     else:
         raise ValueError("Specify either (columns, rows) or (width, length), not both.")
 
+    if output_filename is not None and deterministic:
+        # Reject unsupported formats before the (possibly slow) build
+        exporters.mesh_format(output_filename)
+
     combined_grid_squares = create_grid_squares(
         baseplate_height,
         bottom_chamfer_height,
@@ -112,30 +155,22 @@ def base(
         baseplate_width,
         columns,
         rows,
+        backend,
     )
 
     logging.info("Creating the Gridfinity baseplate and subtracting the grid squares...")
-    gridfinity_baseplate = (
-        cq.Workplane("XY")
-        .box(columns * baseplate_width, rows * baseplate_width, baseplate_height - 0.001)
-        .edges("|Z")
-        .fillet(rounded_corner_radius)
-        .translate(
-            (
-                columns * baseplate_width / 2,
-                rows * baseplate_width / 2,
-                baseplate_height / 2,
-            )
-        )
-        .faces(">Z")
-        .cut(combined_grid_squares)
+    geometry = get_backend(backend)
+    plate = geometry.plate(
+        columns * baseplate_width,
+        rows * baseplate_width,
+        0.0005,
+        baseplate_height - 0.0005,
+        rounded_corner_radius,
     )
+    gridfinity_baseplate = geometry.cut(plate, combined_grid_squares)
 
     if output_filename is not None:
-        logging.info(f"Saving to {output_filename}")
-        cq.exporters.export(
-            gridfinity_baseplate, output_filename, tolerance=0.99, angularTolerance=0.5
-        )
+        export(gridfinity_baseplate, output_filename, deterministic=deterministic, backend=backend)
 
     return gridfinity_baseplate
 
@@ -152,7 +187,9 @@ def bottom(
     bottom_chamfer_height: float = default_bottom_chamfer_height,
     straight_wall_height: float = default_straight_wall_height,
     verbose: bool = default_verbose,
-) -> cq.Workplane:
+    deterministic: bool = default_deterministic,
+    backend: str = default_backend,
+) -> Shape:
     setup_logging(verbose)
 
     if (columns is not None and rows is not None) and (width is None and length is None):
@@ -165,6 +202,10 @@ def bottom(
     else:
         raise ValueError("Specify either (columns, rows) or (width, length), not both.")
 
+    if output_filename is not None and deterministic:
+        # Reject unsupported formats before the (possibly slow) build
+        exporters.mesh_format(output_filename)
+
     combined_grid_squares = create_grid_squares(
         baseplate_height,
         bottom_chamfer_height,
@@ -174,13 +215,11 @@ def bottom(
         baseplate_width,
         columns,
         rows,
+        backend,
     )
 
     logging.info("Creating the Gridfinity baseplate and subtracting the grid squares...")
 
     if output_filename is not None:
-        logging.info(f"Saving to {output_filename}")
-        cq.exporters.export(
-            combined_grid_squares, output_filename, tolerance=0.99, angularTolerance=0.5
-        )
+        export(combined_grid_squares, output_filename, deterministic=deterministic, backend=backend)
     return combined_grid_squares
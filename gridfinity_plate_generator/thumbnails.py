@@ -0,0 +1,324 @@
+"""Headless, CPU-only PNG thumbnails of plate meshes.
+
+Meshes are shaded with a single directional light, rasterised with a z-buffer
+in vectorised NumPy and written as PNG without any GPU, browser or imaging
+library. ``render_thumbnails`` spreads a batch of meshes over a process pool.
+"""
+
+import logging
+import os
+import struct
+import zipfile
+import zlib
+from collections import Counter
+from collections.abc import Sequence
+from concurrent.futures import ProcessPoolExecutor
+from typing import TYPE_CHECKING
+from typing import cast
+from xml.etree import ElementTree
+
+import numpy as np
+import numpy.typing as npt
+import stl
+
+from gridfinity_plate_generator.config import default_backend
+from gridfinity_plate_generator.config import default_thumbnail_size
+
+
+if TYPE_CHECKING:
+    from gridfinity_plate_generator.backends import Shape
+
+
+BACKGROUND = (255, 255, 255)
+COLOR = (70, 130, 180)
+AMBIENT = 0.35
+MARGIN = 0.05
+SUPERSAMPLING = 2
+# Candidate pixels rasterised at once, bounds memory use for large triangles
+CHUNK_PIXELS = 1 << 22
+
+# Isometric-style view from the front-right, looking down at the plate
+AZIMUTH = np.radians(-45.0)
+ELEVATION = np.radians(35.264)
+LIGHT = np.array([0.3, 0.5, 1.0]) / np.linalg.norm([0.3, 0.5, 1.0])
+
+# (n, 3, 3) triangle vertices, or any other float array
+Array = npt.NDArray[np.float64]
+Image = npt.NDArray[np.uint8]
+
+MESH_FORMATS = ("stl", "3mf")
+CORE_NAMESPACE = "{http://schemas.microsoft.com/3dmanufacturing/core/2015/02}"
+
+
+def _view_matrix() -> Array:
+    """Rotation mapping model coordinates to (screen x, screen y, depth)."""
+    cos_a, sin_a = np.cos(AZIMUTH), np.sin(AZIMUTH)
+    cos_e, sin_e = np.cos(ELEVATION), np.sin(ELEVATION)
+    spin = np.array([[cos_a, -sin_a, 0.0], [sin_a, cos_a, 0.0], [0.0, 0.0, 1.0]])
+    # Tilt the XY plane away from the viewer so +Z points up the screen
+    tilt = np.array([[1.0, 0.0, 0.0], [0.0, sin_e, cos_e], [0.0, -cos_e, sin_e]])
+    return cast(Array, tilt @ spin)
+
+
+def _load_3mf(filename: str) -> Array:
+    # Build item transforms are ignored, exported plates never use them
+    meshes = []
+    with zipfile.ZipFile(filename) as archive:
+        for name in archive.namelist():
+            if not name.lower().endswith(".model"):
+                continue
+            model = ElementTree.fromstring(archive.read(name))
+            for mesh in model.iter(f"{CORE_NAMESPACE}mesh"):
+                vertices = np.array(
+                    [
+                        [float(vertex.get(axis, 0.0)) for axis in "xyz"]
+                        for vertex in mesh.iter(f"{CORE_NAMESPACE}vertex")
+                    ],
+                    dtype=np.float64,
+                ).reshape(-1, 3)
+                triangles = np.array(
+                    [
+                        [int(triangle.get(corner, 0)) for corner in ("v1", "v2", "v3")]
+                        for triangle in mesh.iter(f"{CORE_NAMESPACE}triangle")
+                    ],
+                    dtype=np.int64,
+                ).reshape(-1, 3)
+                meshes.append(vertices[triangles])
+    return np.concatenate(meshes) if meshes else np.empty((0, 3, 3))
+
+
+def load_mesh(filename: str) -> Array:
+    """Return the ``(n, 3, 3)`` triangle array of an STL or 3MF file.
+
+    Raises a ValueError for other formats and for files without triangles,
+    which is how numpy-stl reads most corrupt STL files.
+    """
+    extension = os.path.splitext(filename)[1].lstrip(".").lower()
+    if extension == "stl":
+        triangles = np.asarray(stl.mesh.Mesh.from_file(filename).vectors, dtype=np.float64)
+    elif extension == "3mf":
+        triangles = _load_3mf(filename)
+    else:
+        raise ValueError(f"Thumbnails support {', '.join(MESH_FORMATS)}, not '{extension}'.")
+
+    if not len(triangles):
+        raise ValueError(f"No triangles found in {filename}.")
+    return triangles
+
+
+def shape_triangles(shape: "Shape", backend: str = default_backend) -> Array:
+    """Tessellate an in-memory shape into an ``(n, 3, 3)`` triangle array."""
+    # Imported here so thumbnail workers do not pay for importing cadquery
+    from gridfinity_plate_generator.backends import get_backend
+
+    vertices, triangles = get_backend(backend).tessellate(shape)
+    return np.asarray(vertices, dtype=np.float64)[np.asarray(triangles, dtype=np.int64)]
+
+
+def _rasterise(
+    screen: Array, colors: Array, size: int, image: Array, depth: Array
+) -> None:
+    """Z-buffer ``screen`` triangles (pixel x, pixel y, depth) into ``image``."""
+    xy = screen[:, :, :2]
+    lo = np.clip(np.floor(xy.min(axis=1)).astype(np.int64), 0, size - 1)
+    hi = np.clip(np.ceil(xy.max(axis=1)).astype(np.int64), 0, size - 1)
+    widths, heights = hi[:, 0] - lo[:, 0] + 1, hi[:, 1] - lo[:, 1] + 1
+    counts = widths * heights
+
+    (a, b, c) = (screen[:, 0], screen[:, 1], screen[:, 2])
+    # Twice the signed area of every triangle, its sign gives the winding
+    area = cast(
+        Array,
+        (b[:, 0] - a[:, 0]) * (c[:, 1] - a[:, 1]) - (b[:, 1] - a[:, 1]) * (c[:, 0] - a[:, 0]),
+    )
+    visible = np.abs(area) > 1e-12
+
+    start = 0
+    while start < len(screen):
+        # Take triangles until the chunk holds CHUNK_PIXELS candidates (at least one)
+        cumulative = np.cumsum(counts[start:])
+        stop = start + max(int(np.searchsorted(cumulative, CHUNK_PIXELS)), 1)
+        chunk = np.arange(start, stop)[visible[start:stop]]
+        start = stop
+        if not len(chunk):
+            continue
+
+        tri = np.repeat(chunk, counts[chunk])
+        offsets = np.cumsum(counts[chunk]) - counts[chunk]
+        local = np.arange(len(tri)) - np.repeat(offsets, counts[chunk])
+        px = lo[tri, 0] + local % widths[tri]
+        py = lo[tri, 1] + local // widths[tri]
+        x, y = px + 0.5, py + 0.5
+
+        # Barycentric weights from edge functions, normalised by the signed area
+        ta, tb, tc = a[tri], b[tri], c[tri]
+        w0 = ((tb[:, 0] - x) * (tc[:, 1] - y) - (tb[:, 1] - y) * (tc[:, 0] - x)) / area[tri]
+        w1 = ((tc[:, 0] - x) * (ta[:, 1] - y) - (tc[:, 1] - y) * (ta[:, 0] - x)) / area[tri]
+        w2 = 1.0 - w0 - w1
+        inside = (w0 >= -1e-9) & (w1 >= -1e-9) & (w2 >= -1e-9)
+        if not inside.any():
+            continue
+
+        tri, px, py = tri[inside], px[inside], py[inside]
+        z = w0[inside] * ta[inside, 2] + w1[inside] * tb[inside, 2] + w2[inside] * tc[inside, 2]
+
+        # Keep the nearest fragment per pixel, then only where it beats the buffer
+        pixel = py * size + px
+        order = np.lexsort((-z, pixel))
+        pixel, z, tri = pixel[order], z[order], tri[order]
+        first = np.ones(len(pixel), dtype=bool)
+        first[1:] = pixel[1:] != pixel[:-1]
+        pixel, z, tri = pixel[first], z[first], tri[first]
+
+        nearer = z > depth[pixel]
+        depth[pixel[nearer]] = z[nearer]
+        image[pixel[nearer]] = colors[tri[nearer]]
+
+
+def render(triangles: Array, size: int = default_thumbnail_size) -> Image:
+    """Render an ``(n, 3, 3)`` triangle array as a shaded ``(size, size, 3)`` image."""
+    scale = size * SUPERSAMPLING
+    image = np.empty((scale * scale, 3), dtype=np.float64)
+    image[:] = BACKGROUND
+    depth = np.full(scale * scale, -np.inf)
+
+    if len(triangles):
+        view = triangles @ _view_matrix().T
+
+        normals = np.cross(view[:, 1] - view[:, 0], view[:, 2] - view[:, 0])
+        lengths = np.linalg.norm(normals, axis=1, keepdims=True)
+        normals = normals / np.where(lengths > 0, lengths, 1.0)
+        # Winding is not trusted, so light both sides of every triangle
+        intensity = AMBIENT + (1.0 - AMBIENT) * np.abs(normals @ LIGHT)
+        colors = intensity[:, None] * np.asarray(COLOR, dtype=np.float64)
+
+        lo, hi = view.reshape(-1, 3).min(axis=0), view.reshape(-1, 3).max(axis=0)
+        extent = max(hi[0] - lo[0], hi[1] - lo[1]) or 1.0
+        factor = scale * (1 - 2 * MARGIN) / extent
+        screen = np.empty_like(view)
+        screen[:, :, 0] = (view[:, :, 0] - (lo[0] + hi[0]) / 2) * factor + scale / 2
+        # Image rows grow downwards while screen y grows upwards
+        screen[:, :, 1] = scale / 2 - (view[:, :, 1] - (lo[1] + hi[1]) / 2) * factor
+        screen[:, :, 2] = view[:, :, 2]
+
+        _rasterise(screen, colors, scale, image, depth)
+
+    # Average supersampled blocks down to the requested size
+    image = image.reshape(size, SUPERSAMPLING, size, SUPERSAMPLING, 3).mean(axis=(1, 3))
+    return cast(Image, np.round(image).astype(np.uint8))
+
+
+def write_png(image: Image, output_filename: str) -> None:
+    """Write an ``(height, width, 3)`` uint8 image as an RGB PNG."""
+    height, width, _ = image.shape
+    rows = np.hstack([np.zeros((height, 1), dtype=np.uint8), image.reshape(height, -1)])
+
+    def chunk(tag: bytes, data: bytes) -> bytes:
+        crc = zlib.crc32(tag + data) & 0xFFFFFFFF
+        return struct.pack(">I", len(data)) + tag + data + struct.pack(">I", crc)
+
+    with open(output_filename, "wb") as f:
+        f.write(b"\x89PNG\r\n\x1a\n")
+        f.write(chunk(b"IHDR", struct.pack(">IIBBBBB", width, height, 8, 2, 0, 0, 0)))
+        f.write(chunk(b"IDAT", zlib.compress(rows.tobytes(), 9)))
+        f.write(chunk(b"IEND", b""))
+
+
+def render_shape(
+    shape: "Shape",
+    output_filename: str,
+    size: int = default_thumbnail_size,
+    backend: str = default_backend,
+) -> str:
+    """Render an in-memory shape straight to a PNG thumbnail.
+
+    Returns:
+        The path of the written thumbnail
+    """
+    write_png(render(shape_triangles(shape, backend), size), output_filename)
+    return output_filename
+
+
+def render_thumbnail(
+    mesh_filename: str, output_filename: str, size: int = default_thumbnail_size
+) -> str:
+    """Render an STL or 3MF file to a PNG thumbnail.
+
+    Returns:
+        The path of the written thumbnail
+    """
+    logging.debug(f"Rendering {mesh_filename} to {output_filename}")
+    write_png(render(load_mesh(mesh_filename), size), output_filename)
+    return output_filename
+
+
+def thumbnail_filename(mesh_filename: str, output_dir: str, root: str | None = None) -> str:
+    """Return the PNG path a mesh's thumbnail is written to.
+
+    The mesh's path relative to ``root`` (by default its own directory) is
+    kept under ``output_dir``, with the extension replaced by ``.png``.
+    """
+    mesh_filename = os.path.abspath(mesh_filename)
+    relative = os.path.relpath(mesh_filename, root or os.path.dirname(mesh_filename))
+    return os.path.join(output_dir, f"{os.path.splitext(relative)[0]}.png")
+
+
+def _try_render_thumbnail(
+    mesh_filename: str, output_filename: str, size: int
+) -> tuple[str | None, str | None]:
+    # Errors are returned as text, exceptions may not pickle back to the parent
+    try:
+        return render_thumbnail(mesh_filename, output_filename, size), None
+    except Exception as e:
+        return None, f"{type(e).__name__}: {e}"
+
+
+def render_thumbnails(
+    mesh_filenames: Sequence[str],
+    output_dir: str,
+    size: int = default_thumbnail_size,
+    max_workers: int | None = None,
+) -> list[str]:
+    """Render thumbnails for a batch of STL/3MF files across a process pool.
+
+    Thumbnails keep the meshes' paths relative to their common directory, so
+    same-named meshes from different directories do not collide; meshes that
+    would still share a thumbnail (e.g. ``plate.stl`` and ``plate.3mf``) raise
+    a ValueError before anything is rendered. A mesh that cannot be read or
+    rendered is logged and skipped, so one bad file does not stop the rest of
+    the batch.
+
+    Returns:
+        The paths of the written thumbnails, in input order, for the meshes
+        that rendered successfully
+    """
+    directories = [os.path.dirname(os.path.abspath(name)) for name in mesh_filenames]
+    root = os.path.commonpath(directories) if directories else None
+    output_filenames = [thumbnail_filename(name, output_dir, root) for name in mesh_filenames]
+
+    duplicates = sorted(name for name, count in Counter(output_filenames).items() if count > 1)
+    if duplicates:
+        raise ValueError(f"Several meshes would be rendered to {', '.join(duplicates)}.")
+    for directory in sorted({os.path.dirname(name) for name in output_filenames} | {output_dir}):
+        os.makedirs(directory, exist_ok=True)
+    logging.info(f"Rendering {len(mesh_filenames)} thumbnail(s) to {output_dir}")
+
+    workers = max_workers or os.cpu_count() or 1
+    written = []
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        results = pool.map(
+            _try_render_thumbnail,
+            mesh_filenames,
+            output_filenames,
+            [size] * len(mesh_filenames),
+            chunksize=max(1, len(mesh_filenames) // (8 * workers)),
+        )
+        for mesh_filename, (output_filename, error) in zip(mesh_filenames, results):
+            if output_filename is None:
+                logging.error(f"Could not render a thumbnail of {mesh_filename}: {error}")
+            else:
+                written.append(output_filename)
+
+    if len(written) < len(mesh_filenames):
+        logging.warning(f"Rendered {len(written)} of {len(mesh_filenames)} thumbnail(s)")
+    return written
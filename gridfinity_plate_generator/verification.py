@@ -0,0 +1,276 @@
+"""Analytic expectations for base plates, checked without tessellating them.
+
+The expected volume, bounding box, face count and pocket count of a base plate
+are derived from its parameters alone, so large plates can be validated
+against cheap BREP properties (volume, bounding box, face and pocket count)
+of the generated shape.
+
+The volume is the integral over height of the material's cross-section area.
+Every cell of a plate with sharp corners holds the same material, so the
+plate is ``columns * rows`` cells minus the four rounded-off plate corners.
+Both cross-sections have closed forms except where the plate fillet meets a
+pocket, which is integrated numerically.
+"""
+
+import math
+from collections.abc import Callable
+from collections.abc import Iterable
+from dataclasses import dataclass
+
+from gridfinity_plate_generator.backends import BoundingBox
+from gridfinity_plate_generator.backends import Shape
+from gridfinity_plate_generator.backends import get_backend
+from gridfinity_plate_generator.config import default_backend
+from gridfinity_plate_generator.config import default_baseplate_height
+from gridfinity_plate_generator.config import default_baseplate_width
+from gridfinity_plate_generator.config import default_bottom_chamfer_height
+from gridfinity_plate_generator.config import default_rounded_corner_radius
+from gridfinity_plate_generator.config import default_straight_wall_height
+from gridfinity_plate_generator.config import default_subtracted_square_width
+
+
+# Clearance between the plate and the subtraction tool at the top and bottom
+PLATE_CLEARANCE = 0.0005
+INTEGRATION_TOLERANCE = 1e-9
+
+
+@dataclass(frozen=True)
+class ExpectedGeometry:
+    """Properties a generated base plate should have."""
+
+    volume: float
+    bounding_box: BoundingBox
+    face_count: int | None
+    pocket_count: int
+
+
+def _integrate(
+    f: Callable[[float], float],
+    start: float,
+    end: float,
+    breakpoints: Iterable[float] = (),
+    tolerance: float = INTEGRATION_TOLERANCE,
+) -> float:
+    """Integrate ``f`` with adaptive Simpson, splitting at ``breakpoints``."""
+
+    def simpson(a: float, fa: float, m: float, fm: float, b: float, fb: float) -> float:
+        return (b - a) / 6 * (fa + 4 * fm + fb)
+
+    def refine(
+        a: float, fa: float, b: float, fb: float, m: float, fm: float, whole: float, tol: float
+    ) -> float:
+        lm, rm = (a + m) / 2, (m + b) / 2
+        flm, frm = f(lm), f(rm)
+        left, right = simpson(a, fa, lm, flm, m, fm), simpson(m, fm, rm, frm, b, fb)
+        if abs(left + right - whole) <= 15 * tol or b - a < 1e-9:
+            return left + right + (left + right - whole) / 15
+        return refine(a, fa, m, fm, lm, flm, left, tol / 2) + refine(
+            m, fm, b, fb, rm, frm, right, tol / 2
+        )
+
+    points = sorted({start, end, *(x for x in breakpoints if start < x < end)})
+    total = 0.0
+    for a, b in zip(points, points[1:]):
+        m = (a + b) / 2
+        fa, fm, fb = f(a), f(m), f(b)
+        total += refine(a, fa, b, fb, m, fm, simpson(a, fa, m, fm, b, fb), tolerance)
+    return total
+
+
+@dataclass(frozen=True)
+class _Profile:
+    baseplate_width: float
+    subtracted_square_width: float
+    rounded_corner_radius: float
+    baseplate_height: float
+    bottom_chamfer_height: float
+    straight_wall_height: float
+
+    @property
+    def top_chamfer_height(self) -> float:
+        return self.baseplate_height - self.bottom_chamfer_height - self.straight_wall_height
+
+    @property
+    def breakpoints(self) -> tuple[float, ...]:
+        """Heights where the cross-section changes shape."""
+        h = self.baseplate_height
+        return (
+            self.bottom_chamfer_height,
+            h - self.top_chamfer_height,
+            h - (self.subtracted_square_width - self.baseplate_width) / 2,
+            h - self.rounded_corner_radius,
+        )
+
+    def pocket(self, z: float) -> tuple[float, float, float]:
+        """Return the pocket's (side, corner radius, overhang past its cell) at height z.
+
+        The chamfers are 45° tapers, so the pocket is inset by the depth
+        travelled through them.
+        """
+        h = self.baseplate_height
+        if z >= h - self.top_chamfer_height:
+            inset = h - z
+        elif z >= self.bottom_chamfer_height:
+            inset = self.top_chamfer_height
+        else:
+            inset = self.top_chamfer_height + self.bottom_chamfer_height - z
+
+        side = self.subtracted_square_width - 2 * inset
+        radius = max(self.rounded_corner_radius - inset, 0.0)
+        return side, radius, (side - self.baseplate_width) / 2
+
+    def cell_area(self, z: float) -> float:
+        """Material area of one cell of a plate with sharp corners."""
+        side, radius, overhang = self.pocket(z)
+        if overhang <= 0:
+            return self.baseplate_width**2 - side**2 + (4 - math.pi) * radius**2
+
+        # Overlapping pockets only leave a pillar at each grid vertex: a square
+        # of half-width ``c`` minus the four pocket corner arcs centred on its
+        # corners. Per quadrant only the nearest arc matters.
+        c = max(radius - overhang, 0.0)
+        if radius <= c:
+            covered = math.pi * radius**2 / 4
+        elif radius >= c * math.sqrt(2):
+            covered = c**2
+        else:
+            outside = math.pi * radius**2 / 4 - (
+                c / 2 * math.sqrt(radius**2 - c**2) + radius**2 / 2 * math.asin(c / radius)
+            )
+            covered = math.pi * radius**2 / 4 - 2 * outside
+        return 4 * (c**2 - covered)
+
+    def corner_area(self, z: float) -> float:
+        """Area removed by one plate fillet that the pocket has not removed already."""
+        fillet = self.rounded_corner_radius
+        _, radius, overhang = self.pocket(z)
+        centre = radius - overhang
+
+        def uncut(x: float) -> float:
+            # The fillet removes y < fillet_edge, the pocket everything above pocket_edge
+            fillet_edge = fillet - math.sqrt(max(fillet**2 - (fillet - x) ** 2, 0.0))
+            if x >= centre:
+                pocket_edge = -overhang
+            elif x >= centre - radius:
+                pocket_edge = centre - math.sqrt(max(radius**2 - (centre - x) ** 2, 0.0))
+            else:
+                pocket_edge = math.inf
+            return max(0.0, min(fillet_edge, pocket_edge))
+
+        return _integrate(uncut, 0.0, fillet, (centre - radius, centre))
+
+
+def expected_base(
+    columns: int,
+    rows: int,
+    baseplate_width: float = default_baseplate_width,
+    subtracted_square_width: float = default_subtracted_square_width,
+    rounded_corner_radius: float = default_rounded_corner_radius,
+    baseplate_height: float = default_baseplate_height,
+    bottom_chamfer_height: float = default_bottom_chamfer_height,
+    straight_wall_height: float = default_straight_wall_height,
+) -> ExpectedGeometry:
+    """Derive the geometry ``gridfinity_generator.base`` should produce.
+
+    Assumes pockets reach no further than their direct neighbours and the
+    plate fillet fits in a cell. Every sweep segment adds four flat faces per
+    pocket and four curved ones while the pocket corners are rounded, and when
+    pockets overlap at the top a flat pillar face is left at every grid vertex
+    except the plate corners, unless the pocket corners cover the pillars. The
+    face count is None for corner radii so small that the plate fillets remove
+    the corner pockets' rounded faces, which this count does not model.
+    """
+    profile = _Profile(
+        baseplate_width,
+        subtracted_square_width,
+        rounded_corner_radius,
+        baseplate_height,
+        bottom_chamfer_height,
+        straight_wall_height,
+    )
+    bottom, top = PLATE_CLEARANCE, baseplate_height - PLATE_CLEARANCE
+
+    cell_volume = _integrate(profile.cell_area, bottom, top, profile.breakpoints)
+    corner_volume = _integrate(profile.corner_area, bottom, top, profile.breakpoints, 1e-7)
+    volume = columns * rows * cell_volume - 4 * corner_volume
+
+    pockets = columns * rows
+    h = baseplate_height
+    # Every segment adds four flat faces per pocket, and four curved ones as
+    # long as the pocket corners are still rounded where the segment starts
+    faces_per_pocket = sum(
+        4 + 4 * (profile.pocket(start)[1] > 0)
+        for start, height in (
+            (h, profile.top_chamfer_height),
+            (h - profile.top_chamfer_height, straight_wall_height),
+            (bottom_chamfer_height, bottom_chamfer_height),
+        )
+        if height > 0
+    )
+
+    _, radius, overhang = profile.pocket(h)
+    # Half-width of the pillar left at each grid vertex by overlapping pockets
+    pillar = radius - overhang
+    if overhang <= 0:
+        top_faces = 1
+    elif pockets > 1 and pillar * math.sqrt(2) >= radius:
+        top_faces = (columns + 1) * (rows + 1) - 4
+    else:
+        top_faces = 0
+        # The plate ends where the pillars peak, or where the pockets stop
+        # overlapping if there are no pillars
+        if pockets > 1 and pillar > 0:
+            top = h - (radius - pillar * math.sqrt(2))
+        else:
+            top = h - overhang
+
+    face_count: int | None = faces_per_pocket * pockets + top_faces + 1 + 8
+    if overhang > 0 and rounded_corner_radius <= overhang * math.sqrt(2):
+        # The plate fillets swallow the corner pockets' rounded corners
+        face_count = None
+
+    return ExpectedGeometry(
+        volume=volume,
+        bounding_box=(0.0, 0.0, bottom, columns * baseplate_width, rows * baseplate_width, top),
+        face_count=face_count,
+        pocket_count=pockets,
+    )
+
+
+def compare(
+    shape: Shape,
+    expected: ExpectedGeometry,
+    backend: str = default_backend,
+    rel_tol: float = 1e-6,
+    abs_tol: float = 1e-3,
+) -> list[str]:
+    """Compare a generated shape with its expected geometry.
+
+    Only cheap BREP properties are queried, the shape is never tessellated.
+
+    Returns:
+        A description of every mismatch, empty if the shape is as expected
+    """
+    geometry = get_backend(backend)
+    mismatches = []
+
+    volume = geometry.volume(shape)
+    if not math.isclose(volume, expected.volume, rel_tol=rel_tol):
+        mismatches.append(f"volume {volume} != expected {expected.volume}")
+
+    bounding_box = geometry.bounding_box(shape)
+    if not all(
+        math.isclose(actual, wanted, abs_tol=abs_tol)
+        for actual, wanted in zip(bounding_box, expected.bounding_box)
+    ):
+        mismatches.append(f"bounding box {bounding_box} != expected {expected.bounding_box}")
+
+    face_count = geometry.face_count(shape)
+    if None not in (face_count, expected.face_count) and face_count != expected.face_count:
+        mismatches.append(f"face count {face_count} != expected {expected.face_count}")
+
+    pocket_count = geometry.pocket_count(shape)
+    if pocket_count is not None and pocket_count != expected.pocket_count:
+        mismatches.append(f"pocket count {pocket_count} != expected {expected.pocket_count}")
+
+    return mismatches
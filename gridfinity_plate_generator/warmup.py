@@ -0,0 +1,149 @@
+"""Warm-up helpers hiding the cadquery/OCCT cold start from the first request.
+
+The first plate built in a fresh process pays for importing the geometry stack,
+initialising OCCT and building the subtraction tool. ``warm_up`` does that work
+up front and measures it, and ``start_worker_pool`` keeps a pool of worker
+processes that have each been warmed up before they receive real requests.
+"""
+
+import importlib
+import logging
+import multiprocessing
+import os
+import time
+from collections.abc import Iterable
+from collections.abc import Sequence
+from concurrent.futures import Future
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from dataclasses import field
+from typing import Any
+
+from gridfinity_plate_generator.config import default_backend
+from gridfinity_plate_generator.config import default_worker_count
+
+
+GEOMETRY_MODULES = ("cadquery", "gridfinity_plate_generator.gridfinity_generator")
+
+
+@dataclass
+class WarmupReport:
+    """Latencies measured while warming up a process, in seconds."""
+
+    import_seconds: float
+    cold_seconds: float
+    warm_seconds: float
+    pid: int = field(default_factory=os.getpid)
+
+    def __str__(self) -> str:
+        return (
+            f"import {self.import_seconds:.2f}s, cold 1x1 plate {self.cold_seconds:.2f}s, "
+            f"warm 1x1 plate {self.warm_seconds:.2f}s"
+        )
+
+
+def _build_plate(backend: str) -> float:
+    from gridfinity_plate_generator import gridfinity_generator
+
+    start = time.perf_counter()
+    gridfinity_generator.base(columns=1, rows=1, backend=backend)
+    return time.perf_counter() - start
+
+
+def warm_up(backend: str = default_backend) -> WarmupReport:
+    """Import the geometry stack and build a 1x1 plate twice.
+
+    The first build initialises OCCT and caches the default profile's
+    subtraction tool, the second shows the latency requests see afterwards.
+    The plates themselves are discarded: no request can reuse a finished
+    plate, and keeping one alive would only hold on to OCCT memory.
+    """
+    start = time.perf_counter()
+    for module in GEOMETRY_MODULES:
+        importlib.import_module(module)
+    import_seconds = time.perf_counter() - start
+
+    report = WarmupReport(
+        import_seconds=import_seconds,
+        cold_seconds=_build_plate(backend),
+        warm_seconds=_build_plate(backend),
+    )
+    logging.info(f"Warm-up finished: {report}")
+    return report
+
+
+_worker_report: WarmupReport | None = None
+
+
+def _initialize_worker(backend: str, modules: Sequence[str]) -> None:
+    global _worker_report
+    # Register the backends the parent process registered outside the package
+    for module in modules:
+        importlib.import_module(module)
+    _worker_report = warm_up(backend)
+
+
+def _worker_ready() -> WarmupReport | None:
+    return _worker_report
+
+
+def start_worker_pool(
+    max_workers: int = default_worker_count,
+    backend: str = default_backend,
+    modules: Sequence[str] | None = None,
+) -> tuple[ProcessPoolExecutor, list[Future[WarmupReport | None]]]:
+    """Start a process pool whose workers are warmed up before first use.
+
+    Workers are started with ``spawn`` so they are safe to create from a
+    threaded server such as Streamlit, and one no-op task per worker is
+    submitted so every worker starts (and warms up) immediately. Each worker
+    imports ``modules`` first, by default those defining the backends
+    registered in this process, and warms up ``backend`` only; other backends
+    build their subtraction tool on first use.
+
+    Returns:
+        Tuple of (pool, futures of the no-op tasks resolving to the warm-up
+        report of the worker that ran them)
+    """
+    if modules is None:
+        from gridfinity_plate_generator.backends import backend_modules
+
+        modules = backend_modules()
+
+    pool = ProcessPoolExecutor(
+        max_workers=max_workers,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=_initialize_worker,
+        initargs=(backend, tuple(modules)),
+    )
+    ready = [pool.submit(_worker_ready) for _ in range(max_workers)]
+    logging.info(f"Started {max_workers} warm-up worker(s) for backend {backend}")
+    return pool, ready
+
+
+def worker_reports(ready: Iterable[Future[WarmupReport | None]]) -> list[WarmupReport]:
+    """Return the warm-up reports of the workers that have finished warming up.
+
+    Does not block: pending or failed tasks are skipped, and a worker that ran
+    several of the no-op tasks is only reported once.
+    """
+    reports: dict[int, WarmupReport] = {}
+    for future in ready:
+        if future.done() and not future.cancelled() and future.exception() is None:
+            report = future.result()
+            if report is not None:
+                reports.setdefault(report.pid, report)
+    return list(reports.values())
+
+
+def generate_plate(plate_type: str, output_filename: str, **kwargs: Any) -> str:
+    """Generate and export a plate; a picklable entry point for pool workers.
+
+    Returns:
+        The path of the exported file
+    """
+    from gridfinity_plate_generator import gridfinity_generator
+
+    generator_func = getattr(gridfinity_generator, plate_type)
+    generator_func(output_filename=output_filename, **kwargs)
+    return output_filename
@@ -0,0 +1,71 @@
+import os
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+
+import app
+from gridfinity_plate_generator import backends
+from gridfinity_plate_generator import warmup
+from gridfinity_plate_generator.backends import CadQueryBackend
+
+
+@pytest.fixture
+def tmp_tempdir(tmp_path: os.PathLike[str], monkeypatch: pytest.MonkeyPatch) -> Iterator[None]:
+    # Generated plates are written to temporary files, keep them out of /tmp
+    monkeypatch.setattr(app.tempfile, "tempdir", str(tmp_path))
+    yield
+
+
+# Both plates should be generated in the worker pool
+
+
+def test_process_user_input_in_pool(tmp_tempdir: None) -> None:
+    pool, _ = warmup.start_worker_pool(max_workers=2)
+    try:
+        models = app.process_user_input(cols=1, rows=1, pool=pool)
+    finally:
+        pool.shutdown()
+
+    assert set(models) == {app.PlateType.BASE, app.PlateType.BOTTOM}
+    assert models[app.PlateType.BASE].name == "gridfinity_base_1x1.stl"
+    assert all(os.path.getsize(model.path) > 0 for model in models.values())
+
+
+# A broken worker pool should be discarded and the plates generated in-process
+
+
+def test_process_user_input_broken_pool(tmp_tempdir: None, monkeypatch: pytest.MonkeyPatch) -> None:
+    cleared = []
+    monkeypatch.setattr(app.start_warm_up, "clear", lambda: cleared.append(True))
+
+    # Every worker fails to initialise, breaking the pool on first use
+    pool = ProcessPoolExecutor(max_workers=1, initializer=int, initargs=("not a number",))
+    models = app.process_user_input(width=84.0, length=42.0, pool=pool)
+
+    assert cleared == [True]
+    assert models[app.PlateType.BOTTOM].name == "gridfinity_bottom_84.0x42.0mm.stl"
+    assert all(os.path.getsize(model.path) > 0 for model in models.values())
+
+
+# Backends the workers never registered should be generated in-process
+
+
+class AppOnlyBackend(CadQueryBackend):
+    """Backend registered at runtime, so pool workers cannot import it."""
+
+
+def test_process_user_input_unknown_pool_backend(
+    tmp_tempdir: None, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(backends, "_BACKENDS", dict(backends._BACKENDS))
+    monkeypatch.setattr(backends, "_INSTANCES", dict(backends._INSTANCES))
+    backends.register_backend("app-only")(AppOnlyBackend)
+
+    pool, _ = warmup.start_worker_pool(max_workers=1)
+    try:
+        models = app.process_user_input(cols=1, rows=1, backend="app-only", pool=pool)
+    finally:
+        pool.shutdown()
+
+    assert all(os.path.getsize(model.path) > 0 for model in models.values())
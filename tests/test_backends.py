@@ -0,0 +1,138 @@
+"""Conformance tests checking every registered backend against known plate geometry."""
+import os
+import sys
+from collections.abc import Iterator
+
+import pytest
+from streamlit.testing.v1 import AppTest
+
+from gridfinity_plate_generator import backends
+from gridfinity_plate_generator import gridfinity_generator
+from gridfinity_plate_generator.backends import CadQueryBackend
+from gridfinity_plate_generator.backends import GeometryBackend
+from gridfinity_plate_generator.backends import available_backends
+from gridfinity_plate_generator.backends import get_backend
+
+
+WRAPPED_BACKEND = "wrapped-cadquery"
+BACKENDS = [*available_backends(), WRAPPED_BACKEND]
+
+# Volume (mm³) and bounding box of plates generated with the default profile
+KNOWN_GEOMETRY = {
+    ("base", 1, 1): (1218.959, (0.0, 0.0, 0.0, 42.0, 42.0, 4.645)),
+    ("base", 2, 3): (7647.018, (0.0, 0.0, 0.0, 84.0, 126.0, 5.0)),
+    ("bottom", 1, 1): (7543.354, (-0.355, -0.355, 0.0, 42.355, 42.355, 5.0)),
+    ("bottom", 2, 3): (45227.952, (-0.355, -0.355, 0.0, 84.355, 126.355, 5.0)),
+}
+
+
+class WrappedCadQueryBackend(CadQueryBackend):
+    """CadQuery backend relying on the generic mesh export of ``GeometryBackend``."""
+
+    export = GeometryBackend.export
+
+
+class ReplacementBackend(WrappedCadQueryBackend):
+    """Class re-registered under the wrapped backend's name."""
+
+
+@pytest.fixture(autouse=True)
+def wrapped_backend(monkeypatch: pytest.MonkeyPatch) -> Iterator[None]:
+    monkeypatch.setattr(backends, "_BACKENDS", dict(backends._BACKENDS))
+    monkeypatch.setattr(backends, "_INSTANCES", dict(backends._INSTANCES))
+    backends.register_backend(WRAPPED_BACKEND)(WrappedCadQueryBackend)
+    yield
+
+
+# Unknown backend names should raise an exception
+
+
+def test_unknown_backend() -> None:
+    with pytest.raises(ValueError):
+        get_backend("does-not-exist")
+
+
+def test_base_unknown_backend() -> None:
+    with pytest.raises(ValueError):
+        gridfinity_generator.base(columns=1, rows=1, backend="does-not-exist")
+
+
+# Registered backends should be listed and selectable by name
+
+
+def test_register_backend() -> None:
+    assert available_backends() == sorted(BACKENDS)
+    assert isinstance(get_backend(WRAPPED_BACKEND), WrappedCadQueryBackend)
+    assert get_backend(WRAPPED_BACKEND) is get_backend(WRAPPED_BACKEND)
+
+
+# Re-registering a backend should not reuse subtraction tools built by the old class
+
+
+def test_reregistered_backend_builds_new_tool() -> None:
+    profile = (5, 0.7, 1.8, 42.71, 4, 42)
+    old_tool = gridfinity_generator.subtraction_tool(*profile, get_backend(WRAPPED_BACKEND))
+
+    backends.register_backend(WRAPPED_BACKEND)(ReplacementBackend)
+    new_tool = gridfinity_generator.subtraction_tool(*profile, get_backend(WRAPPED_BACKEND))
+
+    assert new_tool is not old_tool
+
+
+# Every backend should produce the known volume, bounds and a watertight solid
+
+
+@pytest.mark.parametrize("backend", BACKENDS)  # type: ignore
+@pytest.mark.parametrize("plate_type,columns,rows", KNOWN_GEOMETRY)  # type: ignore
+def test_backend_conformance(backend: str, plate_type: str, columns: int, rows: int) -> None:
+    geometry = get_backend(backend)
+    volume, bounding_box = KNOWN_GEOMETRY[plate_type, columns, rows]
+
+    plate = getattr(gridfinity_generator, plate_type)(columns=columns, rows=rows, backend=backend)
+
+    assert geometry.is_watertight(plate)
+    assert geometry.volume(plate) == pytest.approx(volume, rel=1e-4)
+    assert geometry.bounding_box(plate) == pytest.approx(bounding_box, abs=1e-2)
+
+
+# Every backend should export plates, deterministically or not
+
+
+@pytest.mark.parametrize("backend", BACKENDS)  # type: ignore
+@pytest.mark.parametrize("deterministic", [False, True])  # type: ignore
+def test_backend_export(backend: str, deterministic: bool, tmp_path: os.PathLike[str]) -> None:
+    filename = os.path.join(tmp_path, "plate.stl")
+    plate = gridfinity_generator.base(columns=1, rows=1, backend=backend)
+
+    digest = get_backend(backend).export(plate, filename, deterministic=deterministic)
+
+    assert os.path.getsize(filename) > 0
+    if deterministic:
+        assert digest is not None and len(digest) == 64
+    else:
+        assert digest is None
+
+
+# The app should offer a backend selector once several backends are registered
+
+
+def test_app_backend_selector(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: os.PathLike[str]
+) -> None:
+    def selector_app() -> None:
+        import streamlit as st
+
+        import app
+
+        st.write(app.backend_selector())
+
+    # The app logs to a file in the working directory
+    monkeypatch.chdir(tmp_path)
+    # AppTest leaves its script as __main__, which spawned workers would re-run
+    monkeypatch.setitem(sys.modules, "__main__", sys.modules["__main__"])
+    page = AppTest.from_function(selector_app).run()
+
+    assert not page.exception
+    assert page.selectbox[0].options == sorted(BACKENDS)
+    page.selectbox[0].select(WRAPPED_BACKEND).run()
+    assert page.markdown[0].value == WRAPPED_BACKEND
@@ -1,4 +1,6 @@
 """Test cases for the __main__ module."""
+import os
+
 import pytest
 from typer.testing import CliRunner
 
@@ -14,3 +16,19 @@ def runner() -> CliRunner:
 def test_cli(runner: CliRunner) -> None:
     result = runner.invoke(app, ["--help"])
     assert result.exit_code == 0
+
+
+def test_cli_thumbnail(runner: CliRunner, tmp_path: os.PathLike[str]) -> None:
+    mesh = os.path.join(tmp_path, "plate.stl")
+    result = runner.invoke(app, ["base", "-c", "1", "-r", "1", "-o", mesh])
+    assert result.exit_code == 0
+
+    result = runner.invoke(app, ["thumbnail", mesh, "-o", str(tmp_path), "-s", "32", "-w", "1"])
+    assert result.exit_code == 0
+    assert os.path.exists(os.path.join(tmp_path, "plate.png"))
+
+
+def test_cli_thumbnail_failure(runner: CliRunner, tmp_path: os.PathLike[str]) -> None:
+    mesh = os.path.join(tmp_path, "missing.3mf")
+    result = runner.invoke(app, ["thumbnail", mesh, "-o", str(tmp_path), "-s", "32", "-w", "1"])
+    assert result.exit_code == 1
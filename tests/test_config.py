@@ -0,0 +1,20 @@
+import pytest
+
+from gridfinity_plate_generator import config
+
+
+# Boolean environment variables should be parsed, not just checked for being set
+
+
+@pytest.mark.parametrize(  # type: ignore
+    "value,expected",
+    [("1", True), ("true", True), ("Yes", True), ("0", False), ("false", False), ("", False)],
+)
+def test_get_env_flag(value: str, expected: bool, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("GRIDFINITY_TEST_FLAG", value)
+    assert config.get_env_flag("GRIDFINITY_TEST_FLAG") is expected
+
+
+def test_get_env_flag_default(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.delenv("GRIDFINITY_TEST_FLAG", raising=False)
+    assert config.get_env_flag("GRIDFINITY_TEST_FLAG", default=True) is True
@@ -0,0 +1,66 @@
+import os
+import zipfile
+
+import pytest
+
+from gridfinity_plate_generator import exporters
+
+
+VERTICES = [(0, 0, 0), (1, 0, 0), (0, 1, 0), (0, 0, 1)]
+TRIANGLES = [(0, 2, 1), (0, 1, 3), (0, 3, 2), (1, 2, 3)]
+
+
+# Triangle order and starting vertex should not change the facet list
+
+
+def test_canonical_facets_is_order_independent() -> None:
+    shuffled = [(t[1], t[2], t[0]) for t in reversed(TRIANGLES)]
+    assert exporters.canonical_facets(VERTICES, TRIANGLES) == exporters.canonical_facets(
+        VERTICES, shuffled
+    )
+
+
+# Rounding noise and negative zero should collapse to the same facets
+
+
+def test_canonical_facets_rounds_coordinates() -> None:
+    noisy = [(x + 1e-9, -0.0 if y == 0 else y, z) for x, y, z in VERTICES]
+    assert exporters.canonical_facets(noisy, TRIANGLES) == exporters.canonical_facets(
+        VERTICES, TRIANGLES
+    )
+
+
+# Exporting the same mesh twice should give identical bytes and a sidecar hash
+
+
+@pytest.mark.parametrize("extension", exporters.DETERMINISTIC_FORMATS)  # type: ignore
+def test_export_mesh_is_reproducible(tmp_path: os.PathLike[str], extension: str) -> None:
+    first = os.path.join(tmp_path, f"first.{extension}")
+    second = os.path.join(tmp_path, f"second.{extension}")
+
+    digest = exporters.export_mesh(VERTICES, TRIANGLES, first)
+    assert exporters.export_mesh(VERTICES, list(reversed(TRIANGLES)), second) == digest
+
+    with open(first, "rb") as a, open(second, "rb") as b:
+        assert a.read() == b.read()
+    with open(first + exporters.HASH_SUFFIX, encoding="utf-8") as f:
+        assert f.read() == f"{digest}  first.{extension}\n"
+
+
+# 3MF entries should carry a fixed timestamp
+
+
+def test_export_mesh_3mf_timestamps(tmp_path: os.PathLike[str]) -> None:
+    filename = os.path.join(tmp_path, "plate.3mf")
+    exporters.export_mesh(VERTICES, TRIANGLES, filename)
+
+    with zipfile.ZipFile(filename) as archive:
+        assert {info.date_time for info in archive.infolist()} == {exporters.ZIP_TIMESTAMP}
+
+
+# Formats without a deterministic writer should be rejected
+
+
+def test_export_mesh_unsupported_format(tmp_path: os.PathLike[str]) -> None:
+    with pytest.raises(ValueError):
+        exporters.export_mesh(VERTICES, TRIANGLES, os.path.join(tmp_path, "plate.step"))
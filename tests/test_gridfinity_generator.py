@@ -1,3 +1,5 @@
+import os
+
 import pytest
 
 from gridfinity_plate_generator import gridfinity_generator
@@ -73,3 +75,50 @@ def test_bottom_correct_widht_length_inputs() -> None:
 def test_bottom_incorrect_inputs() -> None:
     with pytest.raises(TypeError):
         gridfinity_generator.bottom(columns="three", rows=3)  # type: ignore
+
+
+# Deterministic exports of the same plate should be byte-identical
+
+
+def test_base_deterministic_export(tmp_path: os.PathLike[str]) -> None:
+    first = os.path.join(tmp_path, "first.stl")
+    second = os.path.join(tmp_path, "second.stl")
+    gridfinity_generator.base(columns=2, rows=1, output_filename=first, deterministic=True)
+    gridfinity_generator.base(columns=2, rows=1, output_filename=second, deterministic=True)
+
+    with open(first, "rb") as a, open(second, "rb") as b:
+        assert a.read() == b.read()
+    assert os.path.exists(first + ".sha256")
+
+
+# Deterministic exports should return the hash recorded in the sidecar
+
+
+def test_export_returns_content_hash(tmp_path: os.PathLike[str]) -> None:
+    filename = os.path.join(tmp_path, "plate.3mf")
+    plate = gridfinity_generator.base(columns=1, rows=1, output_filename=None)
+    digest = gridfinity_generator.export(plate, filename, deterministic=True)
+
+    with open(filename + ".sha256") as f:
+        assert f.read().split() == [digest, "plate.3mf"]
+
+
+# Unsupported deterministic formats should be rejected before building the plate
+
+
+@pytest.mark.parametrize("plate_type", ["base", "bottom"])  # type: ignore
+def test_deterministic_unsupported_format(
+    plate_type: str, monkeypatch: pytest.MonkeyPatch, tmp_path: os.PathLike[str]
+) -> None:
+    def build(*args: object) -> None:
+        pytest.fail("The plate should not be built")
+
+    monkeypatch.setattr(gridfinity_generator, "create_grid_squares", build)
+    generate = getattr(gridfinity_generator, plate_type)
+    with pytest.raises(ValueError):
+        generate(
+            columns=1,
+            rows=1,
+            output_filename=os.path.join(tmp_path, "plate.step"),
+            deterministic=True,
+        )
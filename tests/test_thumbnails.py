@@ -0,0 +1,134 @@
+import os
+
+import numpy as np
+import pytest
+
+from gridfinity_plate_generator import exporters
+from gridfinity_plate_generator import gridfinity_generator
+from gridfinity_plate_generator import thumbnails
+
+
+TETRAHEDRON = np.array(
+    [
+        [[0, 0, 0], [0, 1, 0], [1, 0, 0]],
+        [[0, 0, 0], [1, 0, 0], [0, 0, 1]],
+        [[0, 0, 0], [0, 0, 1], [0, 1, 0]],
+        [[1, 0, 0], [0, 1, 0], [0, 0, 1]],
+    ],
+    dtype=np.float64,
+)
+
+
+# Rendering should shade the mesh on top of the background
+
+
+def test_render_draws_mesh() -> None:
+    image = thumbnails.render(TETRAHEDRON, size=32)
+
+    assert image.shape == (32, 32, 3) and image.dtype == np.uint8
+    assert (image != thumbnails.BACKGROUND).any(axis=2).sum() > 32
+    assert (image[0, 0] == thumbnails.BACKGROUND).all()
+
+
+# An empty mesh should render as plain background
+
+
+def test_render_empty_mesh() -> None:
+    image = thumbnails.render(np.empty((0, 3, 3)), size=8)
+    assert (image == thumbnails.BACKGROUND).all()
+
+
+# Written thumbnails should be valid PNG files
+
+
+def test_write_png(tmp_path: os.PathLike[str]) -> None:
+    filename = os.path.join(tmp_path, "thumbnail.png")
+    thumbnails.write_png(thumbnails.render(TETRAHEDRON, size=16), filename)
+
+    with open(filename, "rb") as f:
+        header = f.read(24)
+    assert header[:8] == b"\x89PNG\r\n\x1a\n"
+    assert int.from_bytes(header[16:20], "big") == int.from_bytes(header[20:24], "big") == 16
+
+
+# Batches of exported plates should be rendered across the process pool
+
+
+def test_render_thumbnails(tmp_path: os.PathLike[str]) -> None:
+    meshes = [os.path.join(tmp_path, f"{name}.stl") for name in ("base", "bottom")]
+    gridfinity_generator.base(columns=2, rows=1, output_filename=meshes[0])
+    gridfinity_generator.bottom(columns=2, rows=1, output_filename=meshes[1])
+
+    output_dir = os.path.join(tmp_path, "thumbnails")
+    written = thumbnails.render_thumbnails(meshes, output_dir, size=32, max_workers=2)
+
+    assert written == [os.path.join(output_dir, f"{name}.png") for name in ("base", "bottom")]
+    assert all(os.path.getsize(filename) > 0 for filename in written)
+
+
+# Unreadable meshes should be skipped without stopping the rest of the batch
+
+
+def test_render_thumbnails_skips_bad_meshes(tmp_path: os.PathLike[str]) -> None:
+    good = os.path.join(tmp_path, "good.stl")
+    gridfinity_generator.base(columns=1, rows=1, output_filename=good)
+    corrupt = os.path.join(tmp_path, "corrupt.stl")
+    with open(corrupt, "wb") as f:
+        f.write(b"not a mesh")
+    missing, unsupported = (os.path.join(tmp_path, name) for name in ("missing.stl", "plate.step"))
+    meshes = [missing, corrupt, good, unsupported]
+
+    output_dir = os.path.join(tmp_path, "thumbnails")
+    written = thumbnails.render_thumbnails(meshes, output_dir, size=16, max_workers=2)
+
+    assert written == [os.path.join(output_dir, "good.png")]
+
+
+# Same-named meshes from different directories should get separate thumbnails
+
+
+def test_render_thumbnails_same_names(tmp_path: os.PathLike[str]) -> None:
+    meshes = [os.path.join(tmp_path, "catalogue", name, "plate.stl") for name in ("a", "b")]
+    for mesh in meshes:
+        os.makedirs(os.path.dirname(mesh))
+    gridfinity_generator.base(columns=3, rows=2, output_filename=meshes[0])
+    gridfinity_generator.bottom(columns=1, rows=1, output_filename=meshes[1])
+
+    output_dir = os.path.join(tmp_path, "thumbnails")
+    written = thumbnails.render_thumbnails(meshes, output_dir, size=32, max_workers=2)
+
+    assert written == [os.path.join(output_dir, name, "plate.png") for name in ("a", "b")]
+    with open(written[0], "rb") as a, open(written[1], "rb") as b:
+        assert a.read() != b.read()
+
+
+# Meshes that would still share a thumbnail should be rejected before rendering
+
+
+def test_render_thumbnails_duplicate_outputs(tmp_path: os.PathLike[str]) -> None:
+    meshes = [os.path.join(tmp_path, name) for name in ("plate.stl", "plate.3mf")]
+    with pytest.raises(ValueError):
+        thumbnails.render_thumbnails(meshes, os.path.join(tmp_path, "thumbnails"), size=16)
+
+
+# 3MF files should load to the same triangles as the STL export
+
+
+def test_load_mesh_3mf(tmp_path: os.PathLike[str]) -> None:
+    vertices, triangles = TETRAHEDRON.reshape(-1, 3), np.arange(12).reshape(-1, 3)
+    for extension in exporters.DETERMINISTIC_FORMATS:
+        exporters.write_mesh(vertices, triangles, os.path.join(tmp_path, f"mesh.{extension}"))
+
+    stl_mesh = thumbnails.load_mesh(os.path.join(tmp_path, "mesh.stl"))
+    threemf_mesh = thumbnails.load_mesh(os.path.join(tmp_path, "mesh.3mf"))
+    assert threemf_mesh.shape == (4, 3, 3)
+    assert np.allclose(np.sort(threemf_mesh, axis=None), np.sort(stl_mesh, axis=None))
+
+
+# In-memory shapes should render without exporting a mesh first
+
+
+def test_render_shape(tmp_path: os.PathLike[str]) -> None:
+    filename = os.path.join(tmp_path, "plate.png")
+    thumbnails.render_shape(gridfinity_generator.base(columns=1, rows=1), filename, size=32)
+    assert os.path.getsize(filename) > 0
@@ -0,0 +1,79 @@
+import math
+import time
+
+import pytest
+
+from gridfinity_plate_generator import gridfinity_generator
+from gridfinity_plate_generator import verification
+
+
+# Generated plates should match the analytically derived geometry; building a
+# 20x20 plate takes OCCT most of a minute, so it only runs with ``-m slow``
+
+
+@pytest.mark.parametrize(  # type: ignore
+    "columns,rows", [(1, 1), (3, 2), pytest.param(20, 20, marks=pytest.mark.slow)]
+)
+def test_base_matches_expected_geometry(columns: int, rows: int) -> None:
+    plate = gridfinity_generator.base(columns=columns, rows=rows)
+    expected = verification.expected_base(columns, rows)
+
+    assert verification.compare(plate, expected) == []
+
+
+# Large plates should be derived quickly and from the same per-cell terms as
+# small ones, so 20x20 expectations are covered without building the plate
+
+
+def test_expected_base_large_plate() -> None:
+    one, two = verification.expected_base(1, 1), verification.expected_base(2, 2)
+    start = time.perf_counter()
+    large = verification.expected_base(20, 20)
+    assert time.perf_counter() - start < 1
+
+    # volume(c, r) = c * r * cell - 4 * corner, face count is linear in pockets
+    cell = (two.volume - one.volume) / 3
+    corner = (cell - one.volume) / 4
+    assert math.isclose(large.volume, 400 * cell - 4 * corner, rel_tol=1e-9)
+    assert two.face_count is not None and large.face_count is not None
+    per_pocket = (two.face_count - 9 - (3 * 3 - 4)) / 4
+    assert large.face_count == 400 * per_pocket + (21 * 21 - 4) + 9
+    assert large.pocket_count == 400
+    assert large.bounding_box == pytest.approx((0, 0, 0.0005, 840, 840, 4.9995))
+
+
+# Non-default profiles should still be derived correctly
+
+
+def test_base_custom_profile_matches_expected_geometry() -> None:
+    profile = dict(baseplate_width=40, subtracted_square_width=40.5, rounded_corner_radius=3)
+    plate = gridfinity_generator.base(columns=2, rows=3, **profile)
+    expected = verification.expected_base(2, 3, **profile)
+
+    assert verification.compare(plate, expected) == []
+
+
+# Small corner radii leave square pocket walls and pointed pillars
+
+
+@pytest.mark.parametrize("rounded_corner_radius", [2, 1])  # type: ignore
+def test_base_small_radius_matches_expected_geometry(rounded_corner_radius: float) -> None:
+    plate = gridfinity_generator.base(
+        columns=2, rows=2, rounded_corner_radius=rounded_corner_radius
+    )
+    expected = verification.expected_base(2, 2, rounded_corner_radius=rounded_corner_radius)
+
+    assert verification.compare(plate, expected) == []
+
+
+# Shapes that differ from the expectation should be reported
+
+
+def test_compare_reports_mismatches() -> None:
+    plate = gridfinity_generator.base(columns=2, rows=2)
+    expected = verification.expected_base(3, 2)
+
+    mismatches = verification.compare(plate, expected)
+    assert any(mismatch.startswith("volume") for mismatch in mismatches)
+    assert any(mismatch.startswith("bounding box") for mismatch in mismatches)
+    assert any(mismatch.startswith("pocket count") for mismatch in mismatches)
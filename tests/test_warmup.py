@@ -0,0 +1,88 @@
+import os
+import sys
+
+import pytest
+
+from gridfinity_plate_generator import backends
+from gridfinity_plate_generator import warmup
+
+
+PLUGIN = """
+from gridfinity_plate_generator.backends import CadQueryBackend
+from gridfinity_plate_generator.backends import register_backend
+
+
+@register_backend("plugin-cadquery")
+class PluginBackend(CadQueryBackend):
+    pass
+"""
+
+
+# Warm-up should measure the import, cold and warm latencies
+
+
+def test_warm_up_report() -> None:
+    report = warmup.warm_up()
+    assert report.import_seconds >= 0
+    assert report.cold_seconds > 0
+    assert report.warm_seconds > 0
+
+
+# Plates generated in the warm worker pool should be exported
+
+
+def test_worker_pool_generates_plate(tmp_path: os.PathLike[str]) -> None:
+    filename = os.path.join(tmp_path, "plate.stl")
+    pool, ready = warmup.start_worker_pool(max_workers=1)
+    try:
+        future = pool.submit(warmup.generate_plate, "base", filename, columns=1, rows=1)
+        assert future.result() == filename
+    finally:
+        pool.shutdown()
+
+    assert os.path.getsize(filename) > 0
+
+
+# Worker pools should report the latencies measured in their workers
+
+
+def test_worker_pool_reports_warm_up() -> None:
+    pool, ready = warmup.start_worker_pool(max_workers=2)
+    try:
+        for future in ready:
+            future.result()
+        reports = warmup.worker_reports(ready)
+    finally:
+        pool.shutdown()
+
+    assert 1 <= len(reports) <= 2
+    assert len({report.pid for report in reports}) == len(reports)
+    assert all(report.pid != os.getpid() and report.warm_seconds > 0 for report in reports)
+
+
+# Backends registered by importable modules should be registered in the workers too
+
+
+def test_worker_pool_registers_plugin_backends(
+    tmp_path: os.PathLike[str], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    with open(os.path.join(tmp_path, "gridfinity_test_plugin.py"), "w") as f:
+        f.write(PLUGIN)
+    monkeypatch.syspath_prepend(str(tmp_path))
+    monkeypatch.delitem(sys.modules, "gridfinity_test_plugin", raising=False)
+    monkeypatch.setattr(backends, "_BACKENDS", dict(backends._BACKENDS))
+    monkeypatch.setattr(backends, "_INSTANCES", dict(backends._INSTANCES))
+    __import__("gridfinity_test_plugin")
+    assert "gridfinity_test_plugin" in backends.backend_modules()
+
+    filename = os.path.join(tmp_path, "plate.stl")
+    pool, _ = warmup.start_worker_pool(max_workers=1)
+    try:
+        assert "plugin-cadquery" in pool.submit(backends.available_backends).result()
+        future = pool.submit(
+            warmup.generate_plate, "base", filename, columns=1, rows=1, backend="plugin-cadquery"
+        )
+        assert future.result() == filename
+    finally:
+        pool.shutdown()
+        sys.modules.pop("gridfinity_test_plugin", None)